@@ -81,7 +81,8 @@ let solve_with_downloads config distro fetcher ~(watcher:#Progress.watcher) requ
   let feed_provider = new Feed_provider_impl.feed_provider config distro in
 
   (* Add [url] to [downloads_in_progress]. When [download] resolves (to a function),
-     call it in the main thread. *)
+     call it in the main thread. The function returns [true] if it changed anything
+     the solver can see (and so we need to solve again). *)
   let add_download url download =
     let url = (url :> Feed_url.parsed_feed_url) in
     seen := DownloadSet.add url !seen;
@@ -91,7 +92,7 @@ let solve_with_downloads config distro fetcher ~(watcher:#Progress.watcher) requ
         (function
           | Safe_exn.T e ->
             watcher#report url (Safe_exn.msg e);
-            Lwt.return (url, fun () -> ())
+            Lwt.return (url, fun () -> false)
           | ex -> Lwt.fail ex (* or report this too? *)
         ) in
     downloads_in_progress := DownloadMap.add url wrapped !downloads_in_progress
@@ -102,29 +103,30 @@ let solve_with_downloads config distro fetcher ~(watcher:#Progress.watcher) requ
     add_download f (dl >|= fun result () ->
       (* (we are now running in the main thread) *)
       match result with
-      | `Problem (msg, next_update) -> (
+      | `Problem (msg, next_update) ->
           watcher#report f msg;
-          match next_update with
+          begin match next_update with
           | None -> ()
-          | Some next -> handle_download f next
-      )
-      | `Aborted_by_user -> ()    (* No need to report this *)
-      | `No_update -> ()
+          | Some next -> handle_download f next end;
+          false
+      | `Aborted_by_user -> false    (* No need to report this *)
+      | `No_update -> false
       | `Update (new_xml, next_update) ->
           feed_provider#replace_feed f (Feed.parse config.system new_xml None);
           (* On success, we also need to refetch any "distribution" feed that depends on this one *)
           feed_provider#forget_distro f;
           forget_feed (`Distribution_feed f);
           (* (we will now refresh, which will trigger distro#check_for_candidates *)
-          match next_update with
+          begin match next_update with
           | None -> ()    (* This is the final update *)
           | Some next ->
               log_info "Accepted update from mirror, but will continue waiting for primary for '%s'" (Feed_url.format_url f);
-              handle_download f next
+              handle_download f next end;
+          true
     ) in
 
   let rec loop ~try_quick_exit =
-    (* Called once at the start, and once for every feed that downloads (or fails to download). *)
+    (* Called once at the start, and again whenever a completed download gives us new information. *)
     let result = Solver.solve_for config feed_provider requirements in
 
     watcher#update (result, feed_provider);
@@ -136,9 +138,12 @@ let solve_with_downloads config distro fetcher ~(watcher:#Progress.watcher) requ
     | (ready, _) ->
         if not ready then force := true;
 
+        (* (the set of feeds used only changes when we re-solve, so collect it once per pass) *)
+        let feeds_used = feed_provider#get_feeds_used in
+
         (* For each remote feed used which we haven't seen yet, start downloading it. *)
         if !force && config.network_use <> Offline then (
-          ListLabels.iter feed_provider#get_feeds_used ~f:(fun f ->
+          ListLabels.iter feeds_used ~f:(fun f ->
             if not (already_seen f) then (
               match f with
               | `Local_feed _ -> ()
@@ -151,30 +156,39 @@ let solve_with_downloads config distro fetcher ~(watcher:#Progress.watcher) requ
 
         (* Check for extra (uninstalled) local distro candidates. *)
         if !force || update_local then (
-          ListLabels.iter feed_provider#get_feeds_used ~f:(fun f ->
+          ListLabels.iter feeds_used ~f:(fun f ->
             match feed_provider#get_feed f with
             | None -> ()
             | Some (master_feed, _) ->
                 let distro_f = `Distribution_feed f in
                 if not (already_seen distro_f) then (
                     add_download distro_f (Distro.check_for_candidates distro ~ui:watcher master_feed >|= fun () () ->
-                      feed_provider#forget_distro f
+                      feed_provider#forget_distro f;
+                      true
                     )
                 )
           )
         );
 
-        match get_values !downloads_in_progress with
-        | [] -> 
-            if config.network_use = Offline && not ready then
-              log_info "Can't choose versions and in off-line mode, so aborting";
-            Lwt.return result;
-        | downloads ->
-            Lwt.choose downloads >>= fun (url, fn) ->
-            downloads_in_progress := DownloadMap.remove url !downloads_in_progress;
-            fn ();    (* Clears the old feed(s) from Feed_cache *)
-            (* Run the solve again with the new information. *)
-            loop ~try_quick_exit:false
+        wait_for_download ~ready result
+
+  (* Wait for the next download to finish. If it changed anything, solve again.
+     Otherwise (e.g. no update, or it failed), the previous result still stands. *)
+  and wait_for_download ~ready result =
+    match get_values !downloads_in_progress with
+    | [] -> 
+        if config.network_use = Offline && not ready then
+          log_info "Can't choose versions and in off-line mode, so aborting";
+        Lwt.return result;
+    | downloads ->
+        Lwt.choose downloads >>= fun (url, fn) ->
+        downloads_in_progress := DownloadMap.remove url !downloads_in_progress;
+        if fn () then (   (* Clears the old feed(s) from Feed_cache *)
+          (* Run the solve again with the new information. *)
+          loop ~try_quick_exit:false
+        ) else (
+          wait_for_download ~ready result
+        )
   in
   loop ~try_quick_exit:(not (!force || update_local)) >|= fun (ready, result) ->
   (ready, result, feed_provider)
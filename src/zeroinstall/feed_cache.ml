@@ -191,8 +191,10 @@ let get_last_check_attempt config url =
       | None -> None
       | Some info -> Some info.Unix.st_mtime
 
-let internal_is_stale config (`Remote_feed url as feed_url) overrides =
-  let now = config.system#time in
+let internal_is_stale ?now config (`Remote_feed url as feed_url) overrides =
+  let now = match now with
+    | Some now -> now
+    | None -> config.system#time in
 
   let is_stale () =
     match get_last_check_attempt config feed_url with
@@ -31,8 +31,9 @@ val save_iface_config : config -> Sigs.iface_uri -> interface_config -> unit
 val is_stale : config -> Feed_url.remote_feed -> bool
 
 (** Low-level part of [is_stale] that doesn't automatically load the feed overrides (needed to get [last_checked]).
- * Useful if you've already loaded them yourself (or confirmed they're missing) to avoid doing it twice. *)
-val internal_is_stale : config -> Feed_url.remote_feed -> Feed_metadata.t option -> bool
+ * Useful if you've already loaded them yourself (or confirmed they're missing) to avoid doing it twice.
+ * [now] defaults to [config.system#time]; pass it in when checking many feeds at once. *)
+val internal_is_stale : ?now:float -> config -> Feed_url.remote_feed -> Feed_metadata.t option -> bool
 
 (** Touch a 'last-check-attempt' timestamp file for this feed.
     This prevents us from repeatedly trying to download a failing feed many
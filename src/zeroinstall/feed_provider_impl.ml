@@ -51,11 +51,12 @@ class feed_provider config distro =
     method was_used feed = FeedMap.mem feed cache
 
     method have_stale_feeds =
+      let now = config.system#time in
       let check url info =
         match url, info with
         | `Local_feed _, _ -> false
-        | `Remote_feed _ as url, None -> Feed_cache.internal_is_stale config url None
-        | `Remote_feed _ as url, Some (_feed, overrides) -> Feed_cache.internal_is_stale config url (Some overrides) in
+        | `Remote_feed _ as url, None -> Feed_cache.internal_is_stale ~now config url None
+        | `Remote_feed _ as url, Some (_feed, overrides) -> Feed_cache.internal_is_stale ~now config url (Some overrides) in
       FeedMap.exists check cache
 
     method replace_feed url new_feed =